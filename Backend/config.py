@@ -16,6 +16,9 @@ class Config:
     # Ollama configuration
     MODEL_NAME = os.getenv('MODEL_NAME', 'mistral')
     OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
+    OLLAMA_MAX_CONNECTIONS = int(os.getenv('OLLAMA_MAX_CONNECTIONS', '100'))
+    OLLAMA_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('OLLAMA_MAX_KEEPALIVE_CONNECTIONS', '40'))
+    OLLAMA_CONNECTION_CACHE_TTL = float(os.getenv('OLLAMA_CONNECTION_CACHE_TTL', '5'))  # Seconds
     
     # API configuration
     API_HOST = os.getenv('API_HOST', '0.0.0.0')
@@ -27,6 +30,9 @@ class Config:
     
     # PII Detection configuration
     HYBRID_MODE_ENABLED = os.getenv('HYBRID_MODE_ENABLED', 'True').lower() in ('true', '1', 't', 'yes')
+    # Run the LLM over regex-supported types too; disable to skip inference when regex covers every requested type
+    ALWAYS_LLM_ENHANCE = os.getenv('ALWAYS_LLM_ENHANCE', 'True').lower() in ('true', '1', 't', 'yes')
+    LLM_BATCH_SIZE = int(os.getenv('LLM_BATCH_SIZE', '8'))  # Max documents per batched LLM call
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     
     # File upload configuration
@@ -71,7 +71,7 @@ class ImprovedPIIService:
             if use_multi_pass:
                 # Use the PII validator to catch any missed PII
                 enhanced_text = self.pii_validator.enhance_redaction(
-                    response.original, response.redacted
+                    response.original, response.redacted, enhanced_request.custom_tags
                 )
                 
                 # If validator made additional redactions, update the response
@@ -85,6 +85,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down PII Redaction API...")
+    if pii_service:
+        await pii_service.aclose()
 
 
 # Create FastAPI app
@@ -1,22 +1,53 @@
 import logging
 import httpx
 import json
-from typing import Dict, Optional, Tuple
+import re
+import secrets
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from config import Config
 from models import ErrorResponse
 from prompt_generator import PromptGenerator
 
 logger = logging.getLogger(__name__)
 
+# One document of a batched redaction response; {boundary} is the escaped per-batch token
+_BATCH_DOC_TEMPLATE = r'=== DOC (\d+) {boundary} ===\n(.*?)\n=== END \1 {boundary} ==='
+
 
 class OllamaClient:
     """Client for interacting with Ollama API"""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model_name: str = "mistral"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model_name: str = "mistral",
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.model_name = model_name
         self.generate_url = f"{self.base_url}/api/generate"
         self.chat_url = f"{self.base_url}/api/chat"
+        # Shared HTTP client so connections to Ollama are pooled and kept alive across calls
+        self._client = client
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=Config.OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=Config.OLLAMA_MAX_CONNECTIONS,
+                    keepalive_expiry=30.0
+                )
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def check_connection(self) -> Tuple[bool, str]:
         """
@@ -26,12 +57,11 @@ class OllamaClient:
             Tuple of (is_connected, status_message)
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                if response.status_code == 200:
-                    return True, "Connected"
-                else:
-                    return False, f"Ollama responded with status {response.status_code}"
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=5.0)
+            if response.status_code == 200:
+                return True, "Connected"
+            else:
+                return False, f"Ollama responded with status {response.status_code}"
         except httpx.ConnectError:
             return False, "Cannot connect to Ollama - is it running?"
         except httpx.TimeoutException:
@@ -60,25 +90,25 @@ class OllamaClient:
                 "top_k": 40
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.generate_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    generated_text = result.get("response", "").strip()
-                    return True, generated_text, None
-                else:
-                    error_msg = f"Ollama API error: {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        error_msg += f" - {error_data.get('error', 'Unknown error')}"
-                    except:
-                        error_msg += f" - {response.text}"
-                    return False, "", error_msg
+            response = await self._get_client().post(
+                self.generate_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                generated_text = result.get("response", "").strip()
+                return True, generated_text, None
+            else:
+                error_msg = f"Ollama API error: {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg += f" - {error_data.get('error', 'Unknown error')}"
+                except:
+                    error_msg += f" - {response.text}"
+                return False, "", error_msg
                     
         except httpx.ConnectError:
             return False, "", "Cannot connect to Ollama - is it running?"
@@ -90,6 +120,54 @@ class OllamaClient:
             logger.error(f"Unexpected error in Ollama client: {str(e)}")
             return False, "", f"Unexpected error: {str(e)}"
 
+    async def generate_text_stream(self, prompt: str, temperature: float = 0.1) -> AsyncIterator[str]:
+        """
+        Generate text using the Ollama streaming API
+        
+        Args:
+            prompt: Input prompt for the model
+            temperature: Sampling temperature (0.0 to 1.0)
+            
+        Yields:
+            Response fragments as the model produces them
+            
+        Raises:
+            RuntimeError: If Ollama returns an error
+            httpx.HTTPError: On connection problems or timeouts
+        """
+        payload = {
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": True,
+            "temperature": temperature,
+            "top_p": 0.9,
+            "top_k": 40
+        }
+        
+        async with self._get_client().stream(
+            "POST",
+            self.generate_url,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=30.0
+        ) as response:
+            if response.status_code != 200:
+                body = (await response.aread()).decode(errors="replace")
+                raise RuntimeError(f"Ollama API error: {response.status_code} - {body}")
+            
+            # Ollama streams one JSON object per line
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                fragment = chunk.get("response", "")
+                if fragment:
+                    yield fragment
+                if chunk.get("done"):
+                    break
+
     async def redact_pii(
         self, 
         text: str, 
@@ -116,7 +194,35 @@ class OllamaClient:
         if not success:
             return False, "", error
         
-        # Clean up the response
+        return True, self.clean_redaction_response(response), None
+
+    async def redact_pii_stream(
+        self,
+        text: str,
+        redact_types: list,
+        custom_tags: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Redact PII from text using Ollama, yielding the response as it is generated
+        
+        The concatenated fragments should be passed through clean_redaction_response.
+        Connection and API errors are raised rather than returned.
+        
+        Args:
+            text: Input text to redact
+            redact_types: List of PII types to redact
+            custom_tags: Optional custom replacement tags
+            
+        Yields:
+            Fragments of the raw model response
+        """
+        prompt = PromptGenerator.generate_redaction_prompt(text, redact_types, custom_tags)
+        async for fragment in self.generate_text_stream(prompt, temperature=0.1):
+            yield fragment
+
+    @staticmethod
+    def clean_redaction_response(response: str) -> str:
+        """Strip whitespace and markdown fences from a redaction response"""
         redacted_text = response.strip()
         
         # Remove any markdown formatting if present
@@ -125,7 +231,49 @@ class OllamaClient:
             if len(lines) > 2:
                 redacted_text = '\n'.join(lines[1:-1])
         
-        return True, redacted_text, None
+        return redacted_text
+
+    async def redact_pii_batch(
+        self,
+        texts: List[str],
+        redact_types: list,
+        custom_tags: Optional[Dict[str, str]] = None
+    ) -> Tuple[bool, List[Optional[str]], Optional[str]]:
+        """
+        Redact PII from several documents with a single Ollama call
+        
+        Args:
+            texts: Input documents to redact
+            redact_types: List of PII types to redact
+            custom_tags: Optional custom replacement tags
+            
+        Returns:
+            Tuple of (success, redacted_texts, error_message). Unless every document
+            comes back exactly once, the call fails and every entry is None, so
+            callers can redact the documents one by one instead.
+        """
+        # A fresh random boundary per batch, so no document can forge another's markers
+        boundary = secrets.token_hex(16)
+        while any(boundary in text for text in texts):
+            boundary = secrets.token_hex(16)
+        prompt = PromptGenerator.generate_batch_redaction_prompt(texts, redact_types, boundary, custom_tags)
+        
+        # Call Ollama
+        success, response, error = await self.generate_text(prompt, temperature=0.1)
+        
+        if not success:
+            return False, [None] * len(texts), error
+        
+        documents = re.findall(_BATCH_DOC_TEMPLATE.format(boundary=re.escape(boundary)), response, re.S)
+        numbers = sorted(int(number) for number, _ in documents)
+        if numbers != list(range(1, len(texts) + 1)):
+            return False, [None] * len(texts), "Batch response does not contain every document exactly once"
+        
+        redacted_texts: List[Optional[str]] = [None] * len(texts)
+        for number, redacted_text in documents:
+            redacted_texts[int(number) - 1] = redacted_text.strip()
+        
+        return True, redacted_texts, None
 
     async def analyze_pii(
         self, 
@@ -1,5 +1,10 @@
+import asyncio
 import logging
+import re
+import time
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
+from config import Config
 from ollama_client import OllamaClient
 from regex_redactor import RegexRedactor
 from models import RedactRequest, RedactResponse
@@ -7,13 +12,56 @@ from prompt_generator import PromptGenerator
 
 logger = logging.getLogger(__name__)
 
+# Default redaction tags emitted by the regex and LLM passes
+_TAG_RE = re.compile(r'\[REDACTED_([A-Z_]+)\]')
+
+# Minimum amount of streamed LLM output to buffer before scanning it for tags
+_STREAM_SCAN_SIZE = 256
+
 
 class PIIService:
     """Main service for PII redaction with hybrid LLM + regex approach"""
     
+    __slots__ = (
+        'ollama_client',
+        'regex_redactor',
+        'always_llm_enhance',
+        '_all_supported_pii_types_set',
+        '_all_supported_pii_types',
+        '_supported_types',
+        '_expanded_types_cache',
+        '_conn_cache',
+    )
+    
     def __init__(self, ollama_client: OllamaClient):
         self.ollama_client = ollama_client
         self.regex_redactor = RegexRedactor()
+        self.always_llm_enhance = Config.ALWAYS_LLM_ENHANCE
+        
+        # Supported types are fixed for the lifetime of the process, so compute them once
+        self._all_supported_pii_types_set = frozenset(
+            set(self.regex_redactor.get_supported_types()) | set(PromptGenerator.get_all_pii_types())
+        )
+        self._all_supported_pii_types = tuple(sorted(self._all_supported_pii_types_set))
+        self._supported_types: Optional[Dict[str, List[str]]] = None
+        self._expanded_types_cache: Dict[frozenset, Tuple[str, ...]] = {}
+        
+        # (checked_at, is_connected, status) of the last Ollama connection check
+        self._conn_cache: Optional[Tuple[float, bool, str]] = None
+    
+    async def aclose(self):
+        """Release the Ollama client's pooled connections"""
+        await self.ollama_client.aclose()
+    
+    async def _check_connection(self) -> Tuple[bool, str]:
+        """Check the Ollama connection, reusing the result for OLLAMA_CONNECTION_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._conn_cache is not None and now - self._conn_cache[0] < Config.OLLAMA_CONNECTION_CACHE_TTL:
+            return self._conn_cache[1], self._conn_cache[2]
+        
+        is_connected, status = await self.ollama_client.check_connection()
+        self._conn_cache = (now, is_connected, status)
+        return is_connected, status
         
     async def redact_text(
         self, 
@@ -35,15 +83,7 @@ class PIIService:
         try:
             # If auto_detect_all is enabled, expand redact_types to include all supported types
             if auto_detect_all:
-                all_types = self.get_all_supported_pii_types()
-                # Combine requested types with all supported types, removing duplicates
-                expanded_types = list(set(request.redact_types + all_types))
-                # Create new request with expanded types
-                enhanced_request = RedactRequest(
-                    text=request.text,
-                    redact_types=expanded_types,
-                    custom_tags=request.custom_tags
-                )
+                enhanced_request = self._expand_request(request)
             else:
                 enhanced_request = request
             
@@ -56,14 +96,165 @@ class PIIService:
             logger.error(f"Error in PII redaction: {str(e)}")
             return False, None, f"Internal error: {str(e)}"
     
-    async def _hybrid_redact(self, request: RedactRequest) -> Tuple[bool, RedactResponse, Optional[str]]:
+    def _expand_request(self, request: RedactRequest) -> RedactRequest:
+        """Create a request whose redact_types also include all supported types"""
+        # Common case: the request already covers everything, so skip the copy
+        if self._all_supported_pii_types_set.issubset(request.redact_types):
+            return request
+        # The expanded types are all known-valid, so copying skips re-validation
+        return request.model_copy(
+            update={"redact_types": list(self._get_expanded_types(request.redact_types))}
+        )
+    
+    def _get_expanded_types(self, redact_types: List[str]) -> Tuple[str, ...]:
+        """Combine requested types with all supported types, memoized per type set"""
+        key = frozenset(redact_types)
+        expanded = self._expanded_types_cache.get(key)
+        if expanded is None:
+            expanded = tuple(sorted(key | self._all_supported_pii_types_set))
+            self._expanded_types_cache[key] = expanded
+        return expanded
+    
+    async def redact_batch(
+        self,
+        requests: List[RedactRequest],
+        use_hybrid: bool = True,
+        auto_detect_all: bool = True,
+        caller_ids: Optional[List[str]] = None
+    ) -> List[Tuple[bool, RedactResponse, Optional[str]]]:
         """
-        Enhanced hybrid redaction with comprehensive PII detection
+        Redact several independent requests, sharing LLM calls between them
+        
+        Requests from the same caller with the same PII types and custom tags are
+        grouped and sent to the LLM together in chunks of up to Config.LLM_BATCH_SIZE
+        documents, so the prompt instructions are paid once per chunk instead of once
+        per document. Requests from different callers never share a prompt.
+        
+        Args:
+            requests: RedactRequest objects to process
+            use_hybrid: Whether to use hybrid approach (LLM + regex fallback)
+            auto_detect_all: Whether to automatically detect all supported PII types
+            caller_ids: Caller of each request. If omitted, every request is treated
+                as coming from a different caller and none are batched together.
+            
+        Returns:
+            List of (success, RedactResponse, error_message) tuples in request order
         """
-        text = request.text
-        redact_types = request.redact_types
-        custom_tags = request.custom_tags or {}
+        if not use_hybrid:
+            return list(await asyncio.gather(*(
+                self.redact_text(request, use_hybrid=False, auto_detect_all=auto_detect_all)
+                for request in requests
+            )))
+        
+        # Group requests that can share a prompt
+        expanded_requests = []
+        groups: Dict[Tuple, List[int]] = {}
+        for index, request in enumerate(requests):
+            if auto_detect_all:
+                request = self._expand_request(request)
+            expanded_requests.append(request)
+            caller = caller_ids[index] if caller_ids is not None else index
+            key = (caller, tuple(request.redact_types), tuple(sorted((request.custom_tags or {}).items())))
+            groups.setdefault(key, []).append(index)
+        
+        batch_size = max(1, Config.LLM_BATCH_SIZE)
+        chunks = [
+            indices[i:i + batch_size]
+            for indices in groups.values()
+            for i in range(0, len(indices), batch_size)
+        ]
+        chunk_results = await asyncio.gather(*(
+            self._hybrid_redact_chunk([expanded_requests[i] for i in chunk])
+            for chunk in chunks
+        ))
+        
+        results: List[Tuple[bool, RedactResponse, Optional[str]]] = [None] * len(requests)
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            for index, result in zip(chunk, chunk_result):
+                results[index] = result
+        return results
+    
+    async def _hybrid_redact_chunk(
+        self, requests: List[RedactRequest]
+    ) -> List[Tuple[bool, RedactResponse, Optional[str]]]:
+        """
+        Hybrid redaction for requests sharing PII types and custom tags, with one LLM call
+        """
+        try:
+            if len(requests) < 2:
+                return [await self._hybrid_redact(request) for request in requests]
+            
+            redact_types = requests[0].redact_types
+            custom_tags = requests[0].custom_tags or {}
+            
+            regex_passes = self._regex_pass_batch([request.text for request in requests], redact_types, custom_tags)
+            all_types_for_llm = regex_passes[0][2]
+            llm_outputs: List[Optional[str]] = [None] * len(requests)
+            
+            if all_types_for_llm:
+                is_connected, status = await self._check_connection()
+                
+                if is_connected:
+                    success, batch_outputs, error = await self.ollama_client.redact_pii_batch(
+                        [regex_redacted for regex_redacted, _, _ in regex_passes],
+                        all_types_for_llm, custom_tags
+                    )
+                    if success:
+                        llm_outputs = batch_outputs
+                    else:
+                        logger.warning(f"LLM batch redaction failed: {error}")
+                    
+                    # A failed or malformed batch response leaves every output None, so the
+                    # documents are then redacted one by one
+                    for i, output in enumerate(llm_outputs):
+                        if output is None:
+                            success, output, error = await self.ollama_client.redact_pii(
+                                regex_passes[i][0], all_types_for_llm, custom_tags
+                            )
+                            if success:
+                                llm_outputs[i] = output
+                            else:
+                                logger.warning(f"LLM redaction failed: {error}")
+                else:
+                    logger.warning(f"Ollama not available: {status}")
+            
+            results = []
+            for request, (regex_redacted, regex_summary, _), llm_redacted in zip(requests, regex_passes, llm_outputs):
+                llm_summary = {}
+                final_redacted = regex_redacted
+                if llm_redacted is not None:
+                    final_redacted = llm_redacted
+                    llm_summary = self._get_llm_summary(final_redacted, all_types_for_llm, custom_tags)
+                response = self._build_response(
+                    request.text, final_redacted, redact_types, regex_summary, llm_summary
+                )
+                results.append((True, response, None))
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in batch PII redaction: {str(e)}")
+            return [(False, None, f"Internal error: {str(e)}")] * len(requests)
+    
+    def _regex_pass(
+        self, text: str, redact_types: List[str], custom_tags: Dict[str, str]
+    ) -> Tuple[str, Dict[str, int], List[str]]:
+        """
+        Run the regex stage of hybrid redaction
+        
+        Returns:
+            Tuple of (regex_redacted_text, regex_summary, types_for_llm)
+        """
+        return self._regex_pass_batch([text], redact_types, custom_tags)[0]
+    
+    def _regex_pass_batch(
+        self, texts: List[str], redact_types: List[str], custom_tags: Dict[str, str]
+    ) -> List[Tuple[str, Dict[str, int], List[str]]]:
+        """
+        Run the regex stage of hybrid redaction for documents sharing types and tags
         
+        Returns:
+            List of (regex_redacted_text, regex_summary, types_for_llm) tuples in input order
+        """
         # Split PII types into regex-supported and LLM-only
         regex_types = []
         llm_types = []
@@ -76,61 +267,147 @@ class PIIService:
         
         logger.info(f"Regex types: {len(regex_types)}, LLM types: {len(llm_types)}")
         
-        # Step 1: Use regex for supported types
-        regex_redacted = text
-        regex_summary = {}
+        # Use regex for supported types
+        regex_results = [(text, {}) for text in texts]
         
         if regex_types:
-            regex_redacted, regex_summary = self.regex_redactor.redact_text(
-                text, regex_types, custom_tags
+            if len(texts) == 1:
+                regex_results = [self.regex_redactor.redact_text(texts[0], regex_types, custom_tags)]
+            else:
+                regex_results = self.regex_redactor.redact_batch(texts, regex_types, custom_tags)
+            logger.info(
+                f"Regex redaction found: {sum(sum(summary.values()) for _, summary in regex_results)} items"
             )
-            logger.info(f"Regex redaction found: {sum(regex_summary.values())} items")
+        
+        # Use the LLM for every type as an accuracy pass when enabled; otherwise only
+        # for types regex can't handle, skipping inference entirely when regex covers them all
+        all_types_for_llm = redact_types if self.always_llm_enhance else llm_types
+        
+        return [
+            (regex_redacted, regex_summary, all_types_for_llm)
+            for regex_redacted, regex_summary in regex_results
+        ]
+    
+    @staticmethod
+    def _get_llm_summary(
+        llm_redacted: str,
+        redact_types: List[str],
+        custom_tags: Dict[str, str],
+        tag_counts: Optional[Counter] = None
+    ) -> Dict[str, int]:
+        """
+        Get per-type counts for an LLM redaction by counting the tags in its output
+        
+        This replaces a second analyze_pii inference: the redacted text already
+        says exactly what was redacted. tag_counts may carry [REDACTED_*] counts
+        already collected while the output was streamed.
+        """
+        requested = set(redact_types)
+        if tag_counts is None:
+            tag_counts = Counter(_TAG_RE.findall(llm_redacted))
+        llm_summary = {
+            tag.lower(): count for tag, count in tag_counts.items() if tag.lower() in requested
+        }
+        # Custom tags don't follow the [REDACTED_*] shape, so count them literally
+        for pii_type, tag in custom_tags.items():
+            if pii_type in requested:
+                llm_summary[pii_type] = llm_redacted.count(tag)
+        
+        logger.info(f"LLM redaction enhanced with: {sum(llm_summary.values())} items")
+        return llm_summary
+    
+    @staticmethod
+    def _build_response(
+        text: str,
+        final_redacted: str,
+        redact_types: List[str],
+        regex_summary: Dict[str, int],
+        llm_summary: Dict[str, int]
+    ) -> RedactResponse:
+        """Combine regex and LLM summaries into the final response"""
+        # Start with every requested type at zero, then keep the higher count from either source
+        combined_summary = dict.fromkeys(redact_types, 0)
+        for summary in (regex_summary, llm_summary):
+            for pii_type, count in summary.items():
+                if count > combined_summary.get(pii_type, 0):
+                    combined_summary[pii_type] = count
+        
+        return RedactResponse(
+            original=text,
+            redacted=final_redacted,
+            summary=combined_summary,
+            redact_types_used=redact_types
+        )
+    
+    async def _stream_llm_redaction(
+        self, text: str, redact_types: List[str], custom_tags: Dict[str, str]
+    ) -> Tuple[bool, str, Counter, Optional[str]]:
+        """
+        Stream an LLM redaction, counting [REDACTED_*] tags while generation is in flight
+        
+        Returns:
+            Tuple of (success, redacted_text, tag_counts, error_message)
+        """
+        fragments = []
+        tag_counts = Counter()
+        pending = ""
+        try:
+            async for fragment in self.ollama_client.redact_pii_stream(text, redact_types, custom_tags):
+                fragments.append(fragment)
+                pending += fragment
+                if len(pending) < _STREAM_SCAN_SIZE:
+                    continue
+                # Hold back a trailing tag that may still be incomplete
+                cut = pending.rfind('[')
+                if cut == -1 or ']' in pending[cut:]:
+                    cut = len(pending)
+                tag_counts.update(_TAG_RE.findall(pending, 0, cut))
+                pending = pending[cut:]
+        except Exception as e:
+            return False, "", tag_counts, str(e) or type(e).__name__
+        
+        tag_counts.update(_TAG_RE.findall(pending))
+        redacted_text = self.ollama_client.clean_redaction_response("".join(fragments))
+        return True, redacted_text, tag_counts, None
+    
+    async def _hybrid_redact(self, request: RedactRequest) -> Tuple[bool, RedactResponse, Optional[str]]:
+        """
+        Enhanced hybrid redaction with comprehensive PII detection
+        """
+        text = request.text
+        redact_types = request.redact_types
+        custom_tags = request.custom_tags or {}
+        
+        # Step 1: Use regex for supported types
+        regex_redacted, regex_summary, all_types_for_llm = self._regex_pass(
+            text, redact_types, custom_tags
+        )
         
         # Step 2: Use LLM for remaining types or as enhancement
         llm_summary = {}
         final_redacted = regex_redacted
         
-        # Always use LLM if available, even for regex-supported types for better accuracy
-        all_types_for_llm = redact_types if llm_types or len(regex_types) > 0 else []
-        
         if all_types_for_llm:
             # Check if Ollama is available
-            is_connected, status = await self.ollama_client.check_connection()
+            is_connected, status = await self._check_connection()
             
             if is_connected:
-                success, llm_redacted, error = await self.ollama_client.redact_pii(
+                success, llm_redacted, tag_counts, error = await self._stream_llm_redaction(
                     regex_redacted, all_types_for_llm, custom_tags
                 )
                 
                 if success:
                     final_redacted = llm_redacted
-                    # Get analysis for summary
-                    _, llm_summary, _ = await self.ollama_client.analyze_pii(
-                        text, all_types_for_llm
+                    llm_summary = self._get_llm_summary(
+                        final_redacted, all_types_for_llm, custom_tags, tag_counts
                     )
-                    logger.info(f"LLM redaction enhanced with: {sum(llm_summary.values())} items")
                 else:
                     logger.warning(f"LLM redaction failed: {error}")
                     # Continue with regex-only result
             else:
                 logger.warning(f"Ollama not available: {status}")
         
-        # Combine summaries, prioritizing LLM results for accuracy
-        combined_summary = {**regex_summary}
-        for pii_type, count in llm_summary.items():
-            combined_summary[pii_type] = max(combined_summary.get(pii_type, 0), count)
-        
-        # Ensure all requested types are in summary
-        for pii_type in redact_types:
-            if pii_type not in combined_summary:
-                combined_summary[pii_type] = 0
-        
-        response = RedactResponse(
-            original=text,
-            redacted=final_redacted,
-            summary=combined_summary,
-            redact_types_used=redact_types
-        )
+        response = self._build_response(text, final_redacted, redact_types, regex_summary, llm_summary)
         
         return True, response, None
     
@@ -139,7 +416,7 @@ class PIIService:
         LLM-only redaction approach
         """
         # Check Ollama connection
-        is_connected, status = await self.ollama_client.check_connection()
+        is_connected, status = await self._check_connection()
         
         if not is_connected:
             return False, None, f"Ollama not available: {status}"
@@ -183,7 +460,7 @@ class PIIService:
         """
         try:
             # Check Ollama connection
-            is_connected, status = await self.ollama_client.check_connection()
+            is_connected, status = await self._check_connection()
             
             if not is_connected:
                 return False, {}, f"Ollama not available: {status}"
@@ -207,20 +484,21 @@ class PIIService:
         Returns:
             Dictionary with detailed PII type information
         """
-        return {
-            "regex_supported": self.regex_redactor.get_supported_types(),
-            "all_supported": self.get_all_supported_pii_types(),
-            "critical_types": self.regex_redactor.get_critical_pii_types(),
-            "common_types": self.regex_redactor.get_common_pii_types(),
-            "auto_detect_types": PromptGenerator.get_auto_detect_types(),
-            "total_types": len(self.get_all_supported_pii_types())
-        }
+        if self._supported_types is None:
+            self._supported_types = {
+                "regex_supported": self.regex_redactor.get_supported_types(),
+                "all_supported": self.get_all_supported_pii_types(),
+                "critical_types": self.regex_redactor.get_critical_pii_types(),
+                "common_types": self.regex_redactor.get_common_pii_types(),
+                "auto_detect_types": PromptGenerator.get_auto_detect_types(),
+                "total_types": len(self._all_supported_pii_types)
+            }
+        # Callers add their own metadata, so hand out a copy
+        return dict(self._supported_types)
     
     def get_all_supported_pii_types(self) -> List[str]:
         """Get all supported PII types from all sources"""
-        regex_types = set(self.regex_redactor.get_supported_types())
-        prompt_types = set(PromptGenerator.get_all_pii_types())
-        return sorted(list(regex_types.union(prompt_types)))
+        return list(self._all_supported_pii_types)
     
     async def get_service_status(self) -> Dict[str, str]:
         """
@@ -230,6 +508,7 @@ class PIIService:
             Dictionary with service status details
         """
         is_connected, status = await self.ollama_client.check_connection()
+        self._conn_cache = (time.monotonic(), is_connected, status)
         
         return {
             "service_status": "healthy",
@@ -4,16 +4,39 @@ Helps catch PII that might have been missed in the first pass
 """
 
 import re
+import bisect
 import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple, Set, Optional
 
+try:
+    import ahocorasick  # Optional: single-pass multi-pattern clue scanning
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+
+def _build_clue_automaton(clues_by_type: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton over all contextual clues, if pyahocorasick is installed"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for clues in clues_by_type.values():
+        for clue in clues:
+            automaton.add_word(clue, clue)
+    automaton.make_automaton()
+    return automaton
+
+
 class PIIValidator:
     """Post-processing validation to catch any missed PII"""
     
+    # Stateless: all methods are class/static methods
+    __slots__ = ()
+    
     # Common words that might be mistakenly identified as PII
-    NON_PII_WORDS = {
+    _NON_PII_BASE_WORDS = (
         'january', 'february', 'march', 'april', 'may', 'june', 'july',
         'august', 'september', 'october', 'november', 'december',
         'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
@@ -23,7 +46,13 @@ class PIIValidator:
         'department', 'university', 'college', 'school', 'hospital',
         'building', 'street', 'avenue', 'road', 'boulevard', 'lane',
         'product', 'service', 'model', 'device', 'system'
-    }
+    )
+    # Lower, capitalized and upper-case spellings so matches can be looked up without lowercasing
+    NON_PII_WORDS = frozenset(
+        variant
+        for word in _NON_PII_BASE_WORDS
+        for variant in (word, word.capitalize(), word.upper())
+    )
     
     # Contextual clues that indicate PII might be present
     PII_CONTEXTUAL_CLUES = {
@@ -38,9 +67,16 @@ class PIIValidator:
         'license': ['license:', 'dl#:', 'driver\'s license:', 'license number:'],
         'passport': ['passport:', 'passport number:', 'passport#:'],
     }
+    _CLUE_AUTOMATON = _build_clue_automaton(PII_CONTEXTUAL_CLUES)
+    # Case-insensitive clue patterns, used when lowercasing would shift character offsets
+    _CLUE_PATTERNS = {
+        clue: re.compile(re.escape(clue), re.IGNORECASE)
+        for clues in PII_CONTEXTUAL_CLUES.values()
+        for clue in clues
+    }
     
     # Additional high-precision regex patterns for second-pass validation
-    VALIDATION_PATTERNS = {
+    _RAW_VALIDATION_PATTERNS = {
         'email': r'\b[A-Za-z0-9._-]{2,}@[A-Za-z0-9.-]{2,}\.[A-Za-z]{2,}\b',
         'phone': r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
         'ssn': r'\b\d{3}[-.]?\d{2}[-.]?\d{4}\b',
@@ -50,6 +86,17 @@ class PIIValidator:
         'date': r'\b(?:0?[1-9]|1[0-2])[/-](?:0?[1-9]|[12]\d|3[01])[/-](?:19|20)?\d{2}\b'
     }
     
+    # Compiled once at import time. Each pattern is scanned separately: a fused
+    # alternation reports only one type per position, so e.g. a phone match would hide
+    # an overlapping credit card or SSN.
+    VALIDATION_PATTERNS = {k: re.compile(v) for k, v in _RAW_VALIDATION_PATTERNS.items()}
+    
+    # Alphanumeric tokens of a certain length (potential IDs)
+    _ID_RE = re.compile(r'\b[A-Z0-9]{6,12}\b')
+    
+    # Redaction tags produced by the regex/LLM passes (including the merged generic tag)
+    _REDACTION_TAG_RE = re.compile(r'\[REDACTED(?:_[A-Z_]+)?\]')
+    
     @classmethod
     def validate_text(cls, text: str, already_redacted: Optional[List[Tuple[int, int]]] = None) -> List[Dict]:
         """
@@ -64,13 +111,15 @@ class PIIValidator:
         """
         if already_redacted is None:
             already_redacted = []
+        redacted_index = cls._build_redacted_index(already_redacted)
             
         potential_pii = []
         
         # 1. Check for contextual clues
+        clue_positions = cls._find_clue_positions(text)
         for pii_type, clues in cls.PII_CONTEXTUAL_CLUES.items():
             for clue in clues:
-                clue_pos = text.lower().find(clue)
+                clue_pos = clue_positions.get(clue, -1)
                 if clue_pos >= 0:
                     # Look for potential PII after the clue
                     end_of_clue = clue_pos + len(clue)
@@ -82,7 +131,7 @@ class PIIValidator:
                     after_clue = text[end_of_clue:end_of_line].strip()
                     
                     # Skip if this is already redacted or empty
-                    if after_clue and not cls._is_already_redacted(end_of_clue, end_of_line, already_redacted):
+                    if after_clue and not cls._overlaps_index(end_of_clue, end_of_line, redacted_index):
                         potential_pii.append({
                             'type': pii_type,
                             'text': after_clue,
@@ -93,15 +142,15 @@ class PIIValidator:
         
         # 2. Check for high-precision regex patterns
         for pii_type, pattern in cls.VALIDATION_PATTERNS.items():
-            for match in re.finditer(pattern, text):
+            for match in pattern.finditer(text):
                 start, end = match.span()
                 
                 # Skip if this position is already redacted
-                if cls._is_already_redacted(start, end, already_redacted):
+                if cls._overlaps_index(start, end, redacted_index):
                     continue
                 
                 # Skip common non-PII words
-                if match.group().lower() in cls.NON_PII_WORDS:
+                if match.group() in cls.NON_PII_WORDS:
                     continue
                 
                 potential_pii.append({
@@ -113,15 +162,15 @@ class PIIValidator:
                 })
         
         # 3. Look for alphanumeric tokens of a certain length (potential IDs)
-        for match in re.finditer(r'\b[A-Z0-9]{6,12}\b', text):
+        for match in cls._ID_RE.finditer(text):
             start, end = match.span()
             
             # Skip if this position is already redacted
-            if cls._is_already_redacted(start, end, already_redacted):
+            if cls._overlaps_index(start, end, redacted_index):
                 continue
             
             # Skip common non-PII words
-            if match.group().lower() in cls.NON_PII_WORDS:
+            if match.group() in cls.NON_PII_WORDS:
                 continue
             
             potential_pii.append({
@@ -134,65 +183,144 @@ class PIIValidator:
         
         return potential_pii
     
+    @classmethod
+    def _find_clue_positions(cls, text: str) -> Dict[str, int]:
+        """
+        Find the first occurrence of each contextual clue in one pass over the text
+        
+        Args:
+            text: Text to scan (matched case-insensitively)
+            
+        Returns:
+            Mapping of clue to its first start position (clues not found are omitted)
+        """
+        # Lowercase once for all clues
+        lower_text = text.lower()
+        if len(lower_text) != len(text):
+            # Some characters (e.g. 'İ') grow when lowercased, so offsets would not match `text`
+            positions = {}
+            for clue, pattern in cls._CLUE_PATTERNS.items():
+                match = pattern.search(text)
+                if match:
+                    positions[clue] = match.start()
+            return positions
+        
+        positions = {}
+        if cls._CLUE_AUTOMATON is not None:
+            for end_index, clue in cls._CLUE_AUTOMATON.iter(lower_text):
+                if clue not in positions:
+                    positions[clue] = end_index - len(clue) + 1
+            return positions
+        
+        # Fallback without pyahocorasick: one find per clue
+        for clues in cls.PII_CONTEXTUAL_CLUES.values():
+            for clue in clues:
+                clue_pos = lower_text.find(clue)
+                if clue_pos >= 0:
+                    positions[clue] = clue_pos
+        return positions
+    
+    @staticmethod
+    def _build_redacted_index(already_redacted: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        """
+        Sort redacted spans once so overlap checks can use binary search
+        
+        Returns:
+            Tuple of (sorted_starts, running_max_ends)
+        """
+        starts = []
+        max_ends = []
+        max_end = -1
+        for redacted_start, redacted_end in sorted(already_redacted):
+            max_end = max(max_end, redacted_end)
+            starts.append(redacted_start)
+            max_ends.append(max_end)
+        return starts, max_ends
+    
     @staticmethod
-    def _is_already_redacted(start: int, end: int, already_redacted: List[Tuple[int, int]]) -> bool:
+    def _overlaps_index(start: int, end: int, redacted_index: Tuple[List[int], List[int]]) -> bool:
+        """Check a position range against an index built by _build_redacted_index"""
+        starts, max_ends = redacted_index
+        # Last span that starts before `end`; any overlap must be at or before it
+        i = bisect.bisect_left(starts, end) - 1
+        return i >= 0 and max_ends[i] > start
+    
+    @classmethod
+    def _is_already_redacted(cls, start: int, end: int, already_redacted: List[Tuple[int, int]]) -> bool:
         """Check if a position range overlaps with already redacted portions"""
-        for redacted_start, redacted_end in already_redacted:
-            # Check for any overlap
-            if not (end <= redacted_start or start >= redacted_end):
-                return True
-        return False
+        return cls._overlaps_index(start, end, cls._build_redacted_index(already_redacted))
+    
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _redaction_tag_pattern(cls, custom_tag_values: frozenset) -> "re.Pattern":
+        """
+        Build a pattern matching default redaction tags and the given custom tags
+        
+        Custom tags are tried first, longest first, so a custom tag that starts like a
+        default tag is matched in full.
+        """
+        if not custom_tag_values:
+            return cls._REDACTION_TAG_RE
+        literals = [re.escape(tag) for tag in sorted(custom_tag_values, key=len, reverse=True)]
+        return re.compile("|".join(literals + [cls._REDACTION_TAG_RE.pattern]))
     
     @classmethod
-    def enhance_redaction(cls, original_text: str, redacted_text: str) -> str:
+    def enhance_redaction(
+        cls,
+        original_text: str,
+        redacted_text: str,
+        custom_tags: Optional[Dict[str, str]] = None
+    ) -> str:
         """
         Enhance redaction by catching potentially missed PII
         
         Args:
             original_text: Original text before redaction
             redacted_text: Text after first-pass redaction
+            custom_tags: Custom replacement tags used in the first pass, if any
             
         Returns:
             Enhanced redacted text with additional PII redacted
         """
-        # Find already redacted portions by comparing original and redacted texts
-        already_redacted = []
-        i, j = 0, 0
-        while i < len(original_text) and j < len(redacted_text):
-            if original_text[i] != redacted_text[j]:
-                # Found difference - likely a redaction
-                redaction_start = j
-                
-                # Find end of redaction tag
-                while j < len(redacted_text) and redacted_text[j] != ']':
-                    j += 1
-                
-                if j < len(redacted_text):
-                    j += 1  # Include the closing bracket
-                
-                redaction_end = j
-                already_redacted.append((redaction_start, redaction_end))
-                
-                # Skip corresponding original text
-                while i < len(original_text) and (j >= len(redacted_text) or original_text[i] != redacted_text[j]):
-                    i += 1
-            else:
-                i += 1
-                j += 1
+        # Locate the tags the first pass produced: [REDACTED_*] plus any custom tags
+        custom_tag_values = frozenset(tag for tag in (custom_tags or {}).values() if tag)
+        tag_pattern = cls._redaction_tag_pattern(custom_tag_values)
+        already_redacted = [m.span() for m in tag_pattern.finditer(redacted_text)]
         
         # Validate the redacted text to find any missed PII
         potential_missed_pii = cls.validate_text(redacted_text, already_redacted)
         
-        # Sort by position in reverse order to redact from end to beginning
-        potential_missed_pii.sort(key=lambda x: x['position'][0], reverse=True)
+        # Sort by position so the output can be built in a single forward pass
+        potential_missed_pii.sort(key=lambda x: x['position'][0])
         
-        # Apply additional redactions for high-confidence matches
-        enhanced_text = redacted_text
+        # Apply additional redactions for high-confidence matches. Overlapping findings
+        # are merged into one span labelled with the longest finding's type, so a short
+        # early match never leaves the rest of a longer one in clear text.
+        parts = []
+        cursor = 0
+        span_type = None
+        span_start = span_end = type_length = 0
         for pii in potential_missed_pii:
-            if pii['confidence'] >= 0.8:  # Only use high-confidence matches
-                start, end = pii['position']
-                replacement = f"[REDACTED_{pii['type'].upper()}]"
-                enhanced_text = enhanced_text[:start] + replacement + enhanced_text[end:]
-                logger.info(f"Enhanced redaction: {pii['text']} -> {replacement} ({pii['reason']})")
+            if pii['confidence'] < 0.8:  # Only use high-confidence matches
+                continue
+            start, end = pii['position']
+            logger.info(f"Enhanced redaction: {pii['text']} -> {pii['type']} ({pii['reason']})")
+            if span_type is not None and start < span_end:
+                span_end = max(span_end, end)
+                if end - start > type_length:
+                    span_type = pii['type']
+                    type_length = end - start
+                continue
+            if span_type is not None:
+                parts.append(redacted_text[cursor:span_start])
+                parts.append(f"[REDACTED_{span_type.upper()}]")
+                cursor = span_end
+            span_start, span_end, span_type = start, end, pii['type']
+            type_length = end - start
+        if span_type is not None:
+            parts.append(redacted_text[cursor:span_start])
+            parts.append(f"[REDACTED_{span_type.upper()}]")
+            cursor = span_end
+        parts.append(redacted_text[cursor:])
         
-        return enhanced_text
+        return "".join(parts)
@@ -1,13 +1,47 @@
 import re
-from typing import Dict, List, Tuple, Set
-from dataclasses import dataclass
+import bisect
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 
 from config import Config
 
+try:
+    import ahocorasick  # Optional: single-pass organization indicator matching
+except ImportError:
+    ahocorasick = None
 
-@dataclass
-class RedactionMatch:
-    """Represents a PII match found by regex"""
+
+# Types whose patterns only ever match ASCII text; they are scanned with ASCII-only
+# \b/\s/\w semantics, which is markedly faster on long and non-Latin documents.
+# SSN, credit card and other \d-based types stay Unicode-aware so full-width and
+# other non-ASCII digits are still detected, and phone keeps a Unicode \s so
+# numbers separated by no-break or other non-ASCII spaces are still found.
+_ASCII_PII_TYPES = frozenset({"email", "ip_address", "personal_url", "mac_address", "guid"})
+
+
+def _scope_flags(patterns: Dict[str, str]) -> Dict[str, str]:
+    """Wrap the patterns of ASCII-only types in a scoped (?a:...) group"""
+    return {
+        pii_type: f"(?a:{raw})" if pii_type in _ASCII_PII_TYPES else raw
+        for pii_type, raw in patterns.items()
+    }
+
+
+def _build_indicator_automaton(words):
+    """Build an Aho-Corasick automaton over lowercase indicator words, if pyahocorasick is installed"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+class RedactionMatch(NamedTuple):
+    """Represents a PII match found by regex (immutable, no per-instance __dict__)"""
     start: int
     end: int
     text: str
@@ -31,74 +65,78 @@ class RegexRedactor:
     """Regex-based PII redactor for fallback/hybrid mode"""
     
     # Common first names and last names for validation
-    COMMON_FIRST_NAMES = {
-        'john', 'jane', 'michael', 'sarah', 'david', 'emily', 'robert', 'lisa', 'james', 'mary',
-        'william', 'patricia', 'richard', 'jennifer', 'charles', 'linda', 'joseph', 'elizabeth',
-        'thomas', 'barbara', 'christopher', 'susan', 'daniel', 'jessica', 'paul', 'karen',
-        'mark', 'nancy', 'donald', 'betty', 'george', 'helen', 'kenneth', 'sandra', 'steven',
-        'donna', 'edward', 'carol', 'brian', 'ruth', 'ronald', 'sharon', 'anthony', 'michelle',
-        'kevin', 'laura', 'jason', 'sarah', 'matthew', 'kimberly', 'gary', 'deborah', 'timothy',
-        'dorothy', 'jose', 'lisa', 'larry', 'nancy', 'jeffrey', 'karen', 'frank', 'betty',
-        'scott', 'helen', 'eric', 'sandra', 'stephen', 'donna', 'andrew', 'carol', 'raymond',
-        'ruth', 'joshua', 'sharon', 'jerry', 'michelle', 'dennis', 'laura', 'walter', 'sarah',
-        'patrick', 'kimberly', 'peter', 'deborah', 'harold', 'dorothy', 'douglas', 'amy',
-        'henry', 'angela', 'carl', 'ashley', 'arthur', 'brenda', 'ryan', 'pamela', 'roger',
-        'nicole', 'joe', 'samantha', 'juan', 'katherine', 'jack', 'emma', 'albert', 'anna',
-        'jonathan', 'marie', 'wayne', 'julie', 'roy', 'joyce', 'noah', 'grace', 'eugene',
-        'christina', 'ralph', 'evelyn', 'louis', 'rachel', 'philip', 'frances', 'austin',
-        'martha', 'alan', 'olivia', 'sean', 'sophia', 'sean', 'rose', 'mason', 'irene',
-        'ethan', 'alice', 'owen', 'jean', 'liam', 'barbara', 'elijah', 'catherine', 'lucas',
-        'margaret', 'jacob', 'elizabeth', 'benjamin', 'debra', 'alexander', 'rebecca',
-        'nicholas', 'maria', 'nathan', 'gloria', 'aaron', 'teresa', 'isaac', 'diane',
-        'edward', 'julie', 'jordan', 'joyce', 'cooper', 'virginia', 'evan', 'victoria',
-        'andrew', 'kelly', 'ian', 'christina', 'adam', 'joan', 'parker', 'evelyn',
-        'blake', 'judith', 'xavier', 'megan', 'dean', 'cheryl', 'chase', 'andrea',
-        'cole', 'hannah', 'tyler', 'jacqueline', 'marcus', 'martha', 'miles', 'frances'
-    }
+    COMMON_FIRST_NAMES = frozenset({
+        'john', 'jane', 'michael', 'sarah', 'david', 'emily', 'robert', 'lisa', 'james',
+        'mary', 'william', 'patricia', 'richard', 'jennifer', 'charles', 'linda', 'joseph',
+        'elizabeth', 'thomas', 'barbara', 'christopher', 'susan', 'daniel', 'jessica',
+        'paul', 'karen', 'mark', 'nancy', 'donald', 'betty', 'george', 'helen', 'kenneth',
+        'sandra', 'steven', 'donna', 'edward', 'carol', 'brian', 'ruth', 'ronald', 'sharon',
+        'anthony', 'michelle', 'kevin', 'laura', 'jason', 'matthew', 'kimberly', 'gary',
+        'deborah', 'timothy', 'dorothy', 'jose', 'larry', 'jeffrey', 'frank', 'scott',
+        'eric', 'stephen', 'andrew', 'raymond', 'joshua', 'jerry', 'dennis', 'walter',
+        'patrick', 'peter', 'harold', 'douglas', 'amy', 'henry', 'angela', 'carl', 'ashley',
+        'arthur', 'brenda', 'ryan', 'pamela', 'roger', 'nicole', 'joe', 'samantha', 'juan',
+        'katherine', 'jack', 'emma', 'albert', 'anna', 'jonathan', 'marie', 'wayne',
+        'julie', 'roy', 'joyce', 'noah', 'grace', 'eugene', 'christina', 'ralph', 'evelyn',
+        'louis', 'rachel', 'philip', 'frances', 'austin', 'martha', 'alan', 'olivia',
+        'sean', 'sophia', 'rose', 'mason', 'irene', 'ethan', 'alice', 'owen', 'jean',
+        'liam', 'elijah', 'catherine', 'lucas', 'margaret', 'jacob', 'benjamin', 'debra',
+        'alexander', 'rebecca', 'nicholas', 'maria', 'nathan', 'gloria', 'aaron', 'teresa',
+        'isaac', 'diane', 'jordan', 'cooper', 'virginia', 'evan', 'victoria', 'kelly',
+        'ian', 'adam', 'joan', 'parker', 'blake', 'judith', 'xavier', 'megan', 'dean',
+        'cheryl', 'chase', 'andrea', 'cole', 'hannah', 'tyler', 'jacqueline', 'marcus',
+        'miles'
+    })
     
     # Common last names for validation
-    COMMON_LAST_NAMES = {
+    COMMON_LAST_NAMES = frozenset({
         'smith', 'johnson', 'williams', 'brown', 'jones', 'garcia', 'miller', 'davis',
         'rodriguez', 'martinez', 'hernandez', 'lopez', 'gonzalez', 'wilson', 'anderson',
         'thomas', 'taylor', 'moore', 'jackson', 'martin', 'lee', 'perez', 'thompson',
         'white', 'harris', 'sanchez', 'clark', 'ramirez', 'lewis', 'robinson', 'walker',
-        'young', 'allen', 'king', 'wright', 'scott', 'torres', 'nguyen', 'hill',
-        'flores', 'green', 'adams', 'nelson', 'baker', 'hall', 'rivera', 'campbell',
-        'mitchell', 'carter', 'roberts', 'gomez', 'phillips', 'evans', 'turner',
-        'diaz', 'parker', 'cruz', 'edwards', 'collins', 'reyes', 'stewart', 'morris',
-        'morales', 'murphy', 'cook', 'rogers', 'gutierrez', 'ortiz', 'morgan',
-        'cooper', 'peterson', 'bailey', 'reed', 'kelly', 'howard', 'ramos', 'kim',
-        'cox', 'ward', 'richardson', 'watson', 'brooks', 'chavez', 'wood', 'james',
-        'bennett', 'gray', 'mendoza', 'ruiz', 'hughes', 'price', 'alvarez', 'castillo',
-        'sanders', 'patel', 'myers', 'long', 'ross', 'foster', 'jimenez', 'powell',
-        'jenkins', 'perry', 'russell', 'sullivan', 'bell', 'coleman', 'butler',
-        'henderson', 'barnes', 'gonzales', 'fisher', 'vasquez', 'simmons', 'romero',
-        'jordan', 'patterson', 'alexander', 'hamilton', 'graham', 'reynolds', 'griffin',
-        'wallace', 'moreno', 'west', 'cole', 'hayes', 'bryant', 'herrera', 'gibson',
-        'ellis', 'tran', 'medina', 'aguilar', 'stevens', 'murray', 'ford', 'castro',
-        'marshall', 'owen', 'harrison', 'fernandez', 'mcdonald', 'woods', 'washington',
-        'kennedy', 'wells', 'vargas', 'henry', 'chen', 'freeman', 'webb', 'tucker',
-        'guzman', 'burns', 'crawford', 'olson', 'simpson', 'porter', 'hunter',
-        'gordon', 'mendez', 'silva', 'shaw', 'snyder', 'mason', 'dixon', 'munoz',
-        'hunt', 'hicks', 'holmes', 'palmer', 'wagner', 'black', 'robertson', 'boyd',
-        'rose', 'stone', 'salazar', 'fox', 'warren', 'mills', 'meyer', 'rice',
-        'schmidt', 'garza', 'daniels', 'ferguson', 'nichols', 'stephens', 'soto',
-        'weaver', 'ryan', 'gardner', 'payne', 'grant', 'dunn', 'kelley', 'spencer',
-        'hawkins', 'arnold', 'pierce', 'vazquez', 'hansen', 'peters', 'santos',
-        'hart', 'bradley', 'knight', 'elliott', 'cunningham', 'duncan', 'armstrong',
-        'hudson', 'carroll', 'lane', 'riley', 'andrews', 'alonso', 'gilbert',
-        'reynolds', 'burke', 'hanson', 'day', 'robertson', 'hicks', 'medina'
-    }
+        'young', 'allen', 'king', 'wright', 'scott', 'torres', 'nguyen', 'hill', 'flores',
+        'green', 'adams', 'nelson', 'baker', 'hall', 'rivera', 'campbell', 'mitchell',
+        'carter', 'roberts', 'gomez', 'phillips', 'evans', 'turner', 'diaz', 'parker',
+        'cruz', 'edwards', 'collins', 'reyes', 'stewart', 'morris', 'morales', 'murphy',
+        'cook', 'rogers', 'gutierrez', 'ortiz', 'morgan', 'cooper', 'peterson', 'bailey',
+        'reed', 'kelly', 'howard', 'ramos', 'kim', 'cox', 'ward', 'richardson', 'watson',
+        'brooks', 'chavez', 'wood', 'james', 'bennett', 'gray', 'mendoza', 'ruiz', 'hughes',
+        'price', 'alvarez', 'castillo', 'sanders', 'patel', 'myers', 'long', 'ross',
+        'foster', 'jimenez', 'powell', 'jenkins', 'perry', 'russell', 'sullivan', 'bell',
+        'coleman', 'butler', 'henderson', 'barnes', 'gonzales', 'fisher', 'vasquez',
+        'simmons', 'romero', 'jordan', 'patterson', 'alexander', 'hamilton', 'graham',
+        'reynolds', 'griffin', 'wallace', 'moreno', 'west', 'cole', 'hayes', 'bryant',
+        'herrera', 'gibson', 'ellis', 'tran', 'medina', 'aguilar', 'stevens', 'murray',
+        'ford', 'castro', 'marshall', 'owen', 'harrison', 'fernandez', 'mcdonald', 'woods',
+        'washington', 'kennedy', 'wells', 'vargas', 'henry', 'chen', 'freeman', 'webb',
+        'tucker', 'guzman', 'burns', 'crawford', 'olson', 'simpson', 'porter', 'hunter',
+        'gordon', 'mendez', 'silva', 'shaw', 'snyder', 'mason', 'dixon', 'munoz', 'hunt',
+        'hicks', 'holmes', 'palmer', 'wagner', 'black', 'robertson', 'boyd', 'rose',
+        'stone', 'salazar', 'fox', 'warren', 'mills', 'meyer', 'rice', 'schmidt', 'garza',
+        'daniels', 'ferguson', 'nichols', 'stephens', 'soto', 'weaver', 'ryan', 'gardner',
+        'payne', 'grant', 'dunn', 'kelley', 'spencer', 'hawkins', 'arnold', 'pierce',
+        'vazquez', 'hansen', 'peters', 'santos', 'hart', 'bradley', 'knight', 'elliott',
+        'cunningham', 'duncan', 'armstrong', 'hudson', 'carroll', 'lane', 'riley',
+        'andrews', 'alonso', 'gilbert', 'burke', 'hanson', 'day'
+    })
+    
+    # Capitalized spellings, as name candidates appear in text, so they can be
+    # looked up without lowercasing
+    _CAPITALIZED_FIRST_NAMES = frozenset(name.capitalize() for name in COMMON_FIRST_NAMES)
+    _CAPITALIZED_LAST_NAMES = frozenset(name.capitalize() for name in COMMON_LAST_NAMES)
     
     # Regex patterns for different PII types
-    PATTERNS = {
+    _RAW_PATTERNS = {
         "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        "phone": r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
+        # The lookahead rejects positions that cannot start a number before trying the optional prefix
+        "phone": r'\b(?=[+(0-9])(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b',
         "credit_card": r'\b\d{4}[-.\s]?\d{4}[-.\s]?\d{4}[-.\s]?\d{4}\b',
         # Simplified name patterns - will use validation to improve accuracy
         "name": r'\b[A-Z][a-z\'-]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z\'-]+){1,2}(?:\s+(?:Jr\.?|Sr\.?|III|IV|V))?\b',
-        # Address patterns - comprehensive US address matching
-        "address": r'\b\d+(?:\s+[NSEW]\.?)?\s+[A-Za-z0-9\s,.-]+(?:Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Drive|Dr\.?|Lane|Ln\.?|Boulevard|Blvd\.?|Way|Place|Pl\.?|Court|Ct\.?|Circle|Cir\.?|Parkway|Pkwy\.?|Trail|Trl\.?|Commons?|Square|Sq\.?)(?:\s+(?:Apt|Apartment|Suite|Ste|Unit|#)\s*[A-Za-z0-9]+)?\s*,?\s*[A-Za-z\s]+,?\s*(?:[A-Z]{2}|Alabama|Alaska|Arizona|Arkansas|California|Colorado|Connecticut|Delaware|Florida|Georgia|Hawaii|Idaho|Illinois|Indiana|Iowa|Kansas|Kentucky|Louisiana|Maine|Maryland|Massachusetts|Michigan|Minnesota|Mississippi|Missouri|Montana|Nebraska|Nevada|New\s+Hampshire|New\s+Jersey|New\s+Mexico|New\s+York|North\s+Carolina|North\s+Dakota|Ohio|Oklahoma|Oregon|Pennsylvania|Rhode\s+Island|South\s+Carolina|South\s+Dakota|Tennessee|Texas|Utah|Vermont|Virginia|Washington|West\s+Virginia|Wisconsin|Wyoming)\s+\d{5}(?:-\d{4})?\b',
+        # Address patterns - comprehensive US address matching. The street and city runs are
+        # bounded so text that repeats a street suffix cannot backtrack quadratically. State
+        # names are grouped by shared prefix so each position tries only a few branches.
+        "address": r'\b\d+(?:\s+[NSEW]\.?)?\s+[A-Za-z0-9\s,.-]{1,100}(?:Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Drive|Dr\.?|Lane|Ln\.?|Boulevard|Blvd\.?|Way|Place|Pl\.?|Court|Ct\.?|Circle|Cir\.?|Parkway|Pkwy\.?|Trail|Trl\.?|Commons?|Square|Sq\.?)(?:\s+(?:Apt|Apartment|Suite|Ste|Unit|#)\s*[A-Za-z0-9]+)?\s*,?\s*[A-Za-z\s]{1,50},?\s*(?:[A-Z]{2}|A(?:labama|laska|rizona|rkansas)|C(?:alifornia|olorado|onnecticut)|Delaware|Florida|Georgia|Hawaii|I(?:daho|llinois|ndiana|owa)|K(?:ansas|entucky)|Louisiana|M(?:aine|aryland|assachusetts|ichigan|innesota|ississippi|issouri|ontana)|N(?:ebraska|evada|ew\s+(?:Hampshire|Jersey|Mexico|York)|orth\s+(?:Carolina|Dakota))|O(?:hio|klahoma|regon)|Pennsylvania|Rhode\s+Island|South\s+(?:Carolina|Dakota)|T(?:ennessee|exas)|Utah|V(?:ermont|irginia)|W(?:ashington|est\s+Virginia|isconsin|yoming))\s+\d{5}(?:-\d{4})?\b',
         # Date patterns - multiple formats for birth dates and personal dates
         "date": r'(?i:(?:Date\s+of\s+Birth|DOB|Birth\s+Date|Born)[\s:]*)?(?:\b(?:0?[1-9]|1[0-2])[-/.](?:0?[1-9]|[12][0-9]|3[01])[-/.](?:19|20)\d{2}\b|\b(?:0?[1-9]|[12][0-9]|3[01])[-/.](?:0?[1-9]|1[0-2])[-/.](?:19|20)\d{2}\b|\b(?:19|20)\d{2}[-/.](?:0?[1-9]|1[0-2])[-/.](?:0?[1-9]|[12][0-9]|3[01])\b)',
         # SSN patterns
@@ -135,6 +173,73 @@ class RegexRedactor:
         "guid": r'\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b'
     }
     
+    # Compiled once at import time rather than looked up in the re cache on every scan
+    _SCOPED_PATTERNS = _scope_flags(_RAW_PATTERNS)
+    PATTERNS = {k: re.compile(v) for k, v in _SCOPED_PATTERNS.items()}
+    # ASCII-only variants for pure-ASCII text, where they match exactly the same spans
+    # but skip Unicode property lookups for \b, \d, \s and \w
+    _ASCII_PATTERNS = {k: re.compile(v, re.ASCII) for k, v in _SCOPED_PATTERNS.items()}
+    
+    # Cheap preconditions: a type can only match if the text contains a digit (for
+    # _DIGIT_TYPES), an ASCII capital (for _UPPER_TYPES) and at least one of its
+    # _REQUIRED_LITERALS. Types not listed (e.g. vin, biometric) are always scanned.
+    _DIGIT_TYPES = frozenset({
+        "phone", "credit_card", "address", "date", "ssn", "drivers_license", "passport",
+        "bank_account", "medical_record", "employee_id", "license_plate",
+        "insurance_policy", "tax_id", "credit_score"
+    })
+    _REQUIRED_LITERALS = {
+        "email": ("@",),
+        "personal_url": ("http",),
+        "ip_address": (".", ":"),
+        "mac_address": (":", "-"),
+        "guid": ("-",),
+        "tax_id": ("-",),
+    }
+    _UPPER_TYPES = frozenset({"name", "address"})
+    _DIGIT_RE = re.compile(r'\d')
+    _UPPER_RE = re.compile(r'[A-Z]')
+    
+    # Every ASCII byte except 0-9, for bytes.translate; phone digits are always ASCII
+    _NON_DIGIT_BYTES = bytes(code for code in range(128) if not chr(code).isdigit())
+    
+    # Types with extra checks in _validate_pii_match; the rest accept every pattern match
+    _VALIDATED_TYPES = frozenset({
+        "name", "credit_score", "ip_address", "phone", "drivers_license", "bank_account"
+    })
+    
+    # Shape checks for _is_likely_name. Candidates already match the "name" pattern,
+    # so only capitalization and single-letter parts are left to check.
+    _CAPITALIZED_NAME_RE = re.compile(
+        r"(?:[A-Z]\.|[A-Z]['.-]*[a-z][a-z'.-]*)(?:\s+(?:[A-Z]\.|[A-Z]['.-]*[a-z][a-z'.-]*))+"
+    )
+    _SINGLE_LETTER_PART_RE = re.compile(r'(?<!\S)\S(?!\S)')
+    
+    # Words that mark a name candidate as an organization. Matched as plain
+    # substrings of the lowercased candidate in a single pass.
+    ORG_INDICATORS = (
+        'company', 'corp', 'corporation', 'inc', 'llc', 'ltd', 'limited',
+        'hospital', 'medical', 'center', 'clinic', 'university', 'college',
+        'school', 'bank', 'insurance', 'service', 'services', 'solutions',
+        'group', 'associates', 'partners', 'firm', 'office', 'department',
+        'division', 'team', 'organization', 'foundation', 'institute',
+        'authority', 'agency', 'commission', 'board', 'council', 'committee'
+    )
+    _ORG_INDICATOR_AUTOMATON = _build_indicator_automaton(ORG_INDICATORS)
+    # Fallback without pyahocorasick. Kept case-sensitive: an IGNORECASE alternation
+    # loses the first-character prefilter and is several times slower.
+    _ORG_INDICATOR_RE = re.compile(
+        '|'.join(map(re.escape, sorted(ORG_INDICATORS, key=len, reverse=True)))
+    )
+    
+    # Cleanup patterns for clean_overlapping_redactions
+    _CONSECUTIVE_TAGS_RE = re.compile(r'\[REDACTED_[A-Z_]+\](?:\s*\[REDACTED_[A-Z_]+\])+')
+    _SPACE_BEFORE_TAG_RE = re.compile(r'\s+\[REDACTED')
+    _SPACE_AFTER_TAG_RE = re.compile(r'\]\s+')
+    
+    # Joins documents for batch scanning; no pattern can match or cross it
+    _BATCH_SEPARATOR = "\x00"
+    
     # Default replacement tags
     DEFAULT_TAGS = {
         "email": "[REDACTED_EMAIL]",
@@ -177,38 +282,22 @@ class RegexRedactor:
         if len(parts) < 2 or len(parts) > 4:
             return False
         
-        # Check first and last names against common names
-        first_name = parts[0].lower()
-        last_name = parts[-1].lower()
+        # Check first and last names against common names. Candidates match the
+        # "name" pattern, so each part is already capitalized with a lowercase tail.
+        is_common_first = parts[0] in cls._CAPITALIZED_FIRST_NAMES
+        is_common_last = parts[-1] in cls._CAPITALIZED_LAST_NAMES
         
         # If both first and last names are in our common lists, it's likely a name
-        if first_name in cls.COMMON_FIRST_NAMES and last_name in cls.COMMON_LAST_NAMES:
-            return True
-        
-        # If at least one name matches and follows typical name patterns
-        if (first_name in cls.COMMON_FIRST_NAMES or last_name in cls.COMMON_LAST_NAMES):
-            # Check if all parts are properly capitalized
-            for part in parts:
-                if not part[0].isupper() or not part[1:].islower():
-                    # Allow for middle initials
-                    if len(part) == 2 and part.endswith('.'):
-                        continue
-                    return False
+        if is_common_first and is_common_last:
             return True
         
-        # Check for common name patterns even if not in our lists
-        # All parts should be 2+ chars, properly capitalized, and alphabetic (with apostrophes/hyphens)
-        for part in parts:
-            if len(part) < 2:
-                if not (len(part) == 2 and part.endswith('.')):  # Allow middle initials
-                    return False
-            if not part[0].isupper():
-                return False
-            # Allow letters, apostrophes, and hyphens in names
-            if not all(c.isalpha() or c in "'-." for c in part):
-                return False
+        # If at least one name matches, all parts must be properly capitalized
+        # (middle initials like "R." allowed)
+        if is_common_first or is_common_last:
+            return cls._CAPITALIZED_NAME_RE.fullmatch(text) is not None
         
-        return True
+        # Otherwise just reject bare initials and single-letter suffixes
+        return cls._SINGLE_LETTER_PART_RE.search(text) is None
     
     @classmethod
     def _is_likely_organization(cls, text: str) -> bool:
@@ -221,23 +310,19 @@ class RegexRedactor:
         Returns:
             Boolean indicating if text is likely an organization
         """
-        org_indicators = {
-            'company', 'corp', 'corporation', 'inc', 'llc', 'ltd', 'limited',
-            'hospital', 'medical', 'center', 'clinic', 'university', 'college',
-            'school', 'bank', 'insurance', 'service', 'services', 'solutions',
-            'group', 'associates', 'partners', 'firm', 'office', 'department',
-            'division', 'team', 'organization', 'foundation', 'institute',
-            'authority', 'agency', 'commission', 'board', 'council', 'committee'
-        }
-        
         text_lower = text.lower()
-        return any(indicator in text_lower for indicator in org_indicators)
+        if cls._ORG_INDICATOR_AUTOMATON is not None:
+            return next(cls._ORG_INDICATOR_AUTOMATON.iter(text_lower), None) is not None
+        return cls._ORG_INDICATOR_RE.search(text_lower) is not None
 
     @classmethod
     def _validate_pii_match(cls, text: str, pii_type: str) -> bool:
         """
         Enhanced validation for PII matches to reduce false positives
         
+        Results are deliberately not cached: the cache keys would keep matched PII
+        text in memory across requests.
+        
         Args:
             text: The matched text to validate
             pii_type: The type of PII being validated
@@ -245,8 +330,6 @@ class RegexRedactor:
         Returns:
             Boolean indicating if match is valid
         """
-        text_lower = text.lower().strip()
-        
         # Apply specific validations based on PII type
         if pii_type == "name":
             return cls._is_likely_name(text) and not cls._is_likely_organization(text)
@@ -272,13 +355,14 @@ class RegexRedactor:
         
         elif pii_type == "phone":
             # Remove formatting and check if it's a valid phone number length
-            digits_only = ''.join(filter(str.isdigit, text))
+            # (separators may be non-ASCII whitespace, which the ascii encode drops)
+            digits_only = text.encode('ascii', 'ignore').translate(None, cls._NON_DIGIT_BYTES)
             return 10 <= len(digits_only) <= 15
         
         elif pii_type == "drivers_license":
             # Skip common false positives
             false_positives = {'test', 'example', 'sample', 'dummy'}
-            return text_lower not in false_positives
+            return text.lower().strip() not in false_positives
         
         elif pii_type == "bank_account":
             # Skip obviously invalid account numbers
@@ -288,6 +372,125 @@ class RegexRedactor:
         
         return True
 
+    @classmethod
+    def _resolve_tags(cls, custom_tags: Dict[str, str] = None) -> Dict[str, str]:
+        """
+        Get the replacement tags for a call, merging custom tags over the defaults
+        
+        The result has a tag for every supported type and is shared between calls with
+        the same custom tags, so callers must not mutate it.
+        """
+        if not custom_tags:
+            return cls._merged_tags(None)
+        return cls._merged_tags(frozenset(custom_tags.items()))
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _merged_tags(cls, custom_items: frozenset = None) -> Dict[str, str]:
+        """Build the tag mapping for _resolve_tags (cached per distinct set of custom tags)"""
+        tags = {pii_type: f"[REDACTED_{pii_type.upper()}]" for pii_type in cls.PATTERNS}
+        tags.update(cls.DEFAULT_TAGS)
+        if custom_items:
+            tags.update(custom_items)
+        return tags
+
+    @classmethod
+    def _plausible_types(cls, text: str, pii_types: List[str]) -> frozenset:
+        """
+        Narrow the requested types to supported ones whose preconditions hold in the text
+        
+        Args:
+            text: Input text to scan
+            pii_types: Requested PII types
+            
+        Returns:
+            Frozenset of types worth scanning for
+        """
+        has_digit = None
+        has_upper = None
+        plausible = []
+        for pii_type in pii_types:
+            if pii_type not in cls.PATTERNS:
+                continue
+            if pii_type in cls._DIGIT_TYPES:
+                if has_digit is None:
+                    has_digit = cls._DIGIT_RE.search(text) is not None
+                if not has_digit:
+                    continue
+            if pii_type in cls._UPPER_TYPES:
+                if has_upper is None:
+                    has_upper = cls._UPPER_RE.search(text) is not None
+                if not has_upper:
+                    continue
+            literals = cls._REQUIRED_LITERALS.get(pii_type)
+            if literals and not any(literal in text for literal in literals):
+                continue
+            plausible.append(pii_type)
+        return frozenset(plausible)
+
+    @classmethod
+    def _iter_type_matches(cls, text: str, pii_types: frozenset) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield every validated match of each requested type, one type at a time
+        
+        Types are scanned separately, so a match of one type never hides an
+        overlapping match of another.
+        
+        Args:
+            text: Input text to scan
+            pii_types: Supported PII types to look for
+            
+        Yields:
+            Tuples of (start, end, pii_type), type by type in PATTERNS order
+        """
+        # On ASCII text the Unicode and ASCII meanings of \b, \d, \s and \w agree
+        patterns = cls._ASCII_PATTERNS if text.isascii() else cls.PATTERNS
+        for pii_type, pattern in patterns.items():
+            if pii_type not in pii_types:
+                continue
+            validate = pii_type in cls._VALIDATED_TYPES
+            for match in pattern.finditer(text):
+                # Apply enhanced validation to reduce false positives
+                if validate and not cls._validate_pii_match(match.group(), pii_type):
+                    continue
+                yield match.start(), match.end(), pii_type
+
+    @classmethod
+    def _scan(cls, text: str, pii_types: frozenset) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield non-overlapping redaction spans covering every validated PII match
+        
+        Overlapping matches of different types are merged into one span, so every
+        character matched by any requested type is redacted. A merged span is
+        labelled with the type of its longest match, the earliest one winning ties,
+        so 'Ref AB 4111-1111-1111-1111' is one credit_card rather than a
+        license_plate that swallowed part of the number.
+        
+        Args:
+            text: Input text to scan
+            pii_types: Supported PII types to look for
+            
+        Yields:
+            Tuples of (start, end, pii_type) in position order
+        """
+        # Stable sort: matches starting at the same position keep PATTERNS order
+        matches = sorted(cls._iter_type_matches(text, pii_types), key=itemgetter(0))
+        span_type = None
+        span_start = span_end = type_length = 0
+        for start, end, pii_type in matches:
+            if span_type is not None and start < span_end:
+                span_end = max(span_end, end)
+                if end - start > type_length:
+                    span_type = pii_type
+                    type_length = end - start
+                continue
+            if span_type is not None:
+                yield span_start, span_end, span_type
+            span_start, span_end, span_type = start, end, pii_type
+            type_length = end - start
+        if span_type is not None:
+            yield span_start, span_end, span_type
+
     @classmethod
     def find_pii_matches(
         cls, 
@@ -307,32 +510,25 @@ class RegexRedactor:
             List of RedactionMatch objects
         """
         matches = []
-        tags = {**cls.DEFAULT_TAGS}
-        if custom_tags:
-            tags.update(custom_tags)
+        if not text or not pii_types:
+            return matches
+        
+        tags = cls._resolve_tags(custom_tags)
+        
+        requested = cls._plausible_types(text, pii_types)
+        if not requested:
+            return matches
+        
+        # Sort the raw spans by start position, before any match objects are built
+        for start, end, pii_type in sorted(cls._iter_type_matches(text, requested), key=itemgetter(0)):
+            matches.append(RedactionMatch(
+                start=start,
+                end=end,
+                text=text[start:end],
+                pii_type=pii_type,
+                replacement=tags[pii_type]
+            ))
         
-        for pii_type in pii_types:
-            if pii_type in cls.PATTERNS:
-                pattern = cls.PATTERNS[pii_type]
-                replacement = tags.get(pii_type, f"[REDACTED_{pii_type.upper()}]")
-                
-                for match in re.finditer(pattern, text):
-                    match_text = match.group()
-                    
-                    # Apply enhanced validation to reduce false positives
-                    if not cls._validate_pii_match(match_text, pii_type):
-                        continue
-                    
-                    matches.append(RedactionMatch(
-                        start=match.start(),
-                        end=match.end(),
-                        text=match_text,
-                        pii_type=pii_type,
-                        replacement=replacement
-                    ))
-        
-        # Sort matches by start position to process in order
-        matches.sort(key=lambda x: x.start)
         return matches
 
     @classmethod
@@ -345,6 +541,9 @@ class RegexRedactor:
         """
         Redact PII from text using regex patterns
         
+        Spans from _scan are consumed directly as (start, end, type) tuples; use
+        find_pii_matches when RedactionMatch objects are needed.
+        
         Args:
             text: Input text to redact
             pii_types: Types of PII to redact
@@ -353,23 +552,98 @@ class RegexRedactor:
         Returns:
             Tuple of (redacted_text, summary_counts)
         """
-        matches = cls.find_pii_matches(text, pii_types, custom_tags)
+        if not text or not pii_types:
+            return text, {pii_type: 0 for pii_type in pii_types}
         
-        # Create summary counts
-        summary = {}
-        for pii_type in pii_types:
-            summary[pii_type] = len([m for m in matches if m.pii_type == pii_type])
-        
-        # Apply redactions in reverse order to maintain positions
-        redacted_text = text
-        for match in reversed(matches):
-            redacted_text = (
-                redacted_text[:match.start] + 
-                match.replacement + 
-                redacted_text[match.end:]
-            )
-        
-        return redacted_text, summary
+        counts = Counter()
+        requested = cls._plausible_types(text, pii_types)
+        if not requested:
+            return text, {pii_type: 0 for pii_type in pii_types}
+        
+        tags = cls._resolve_tags(custom_tags)
+        
+        if len(requested) == 1 and not requested & cls._VALIDATED_TYPES:
+            # One type with no extra validation: every match is kept, so subn gives the
+            # same result without going through _scan
+            (pii_type,) = requested
+            patterns = cls._ASCII_PATTERNS if text.isascii() else cls.PATTERNS
+            # Escape backslashes so custom tags are inserted literally
+            redacted_text, count = patterns[pii_type].subn(tags[pii_type].replace('\\', '\\\\'), text)
+            summary = {requested_type: 0 for requested_type in pii_types}
+            summary[pii_type] = count
+            return redacted_text, summary
+        
+        parts = []
+        cursor = 0
+        for start, end, pii_type in cls._scan(text, requested):
+            counts[pii_type] += 1
+            parts.append(text[cursor:start])
+            parts.append(tags[pii_type])
+            cursor = end
+        parts.append(text[cursor:])
+        
+        return "".join(parts), {pii_type: counts[pii_type] for pii_type in pii_types}
+
+    @classmethod
+    def redact_batch(
+        cls,
+        texts: List[str],
+        pii_types: List[str],
+        custom_tags: Dict[str, str] = None
+    ) -> List[Tuple[str, Dict[str, int]]]:
+        """
+        Redact several documents with one scan over their concatenation
+        
+        Documents are joined with _BATCH_SEPARATOR, which acts like a string boundary
+        for every pattern, so each result matches what redact_text returns.
+        
+        Args:
+            texts: Input documents to redact
+            pii_types: Types of PII to redact
+            custom_tags: Custom replacement tags
+            
+        Returns:
+            List of (redacted_text, summary_counts) tuples in input order
+        """
+        requested = frozenset(pii_type for pii_type in pii_types if pii_type in cls.PATTERNS)
+        tags = cls._resolve_tags(custom_tags)
+        
+        separator = cls._BATCH_SEPARATOR
+        if (
+            len(texts) < 2
+            or not requested
+            or any(separator in text for text in texts)
+            or any(separator in tag for tag in tags.values())
+        ):
+            return [cls.redact_text(text, pii_types, custom_tags) for text in texts]
+        
+        # Start offset of each document within the combined text
+        offsets = []
+        offset = 0
+        for text in texts:
+            offsets.append(offset)
+            offset += len(text) + len(separator)
+        
+        combined = separator.join(texts)
+        requested = cls._plausible_types(combined, requested)
+        if not requested:
+            return [(text, {pii_type: 0 for pii_type in pii_types}) for text in texts]
+        
+        counts = [Counter() for _ in texts]
+        parts = []
+        cursor = 0
+        for start, end, pii_type in cls._scan(combined, requested):
+            counts[bisect.bisect_right(offsets, start) - 1][pii_type] += 1
+            parts.append(combined[cursor:start])
+            parts.append(tags[pii_type])
+            cursor = end
+        parts.append(combined[cursor:])
+        
+        redacted_texts = "".join(parts).split(separator)
+        return [
+            (redacted_text, {pii_type: doc_counts[pii_type] for pii_type in pii_types})
+            for redacted_text, doc_counts in zip(redacted_texts, counts)
+        ]
 
     @classmethod
     def clean_overlapping_redactions(cls, text: str) -> str:
@@ -382,19 +656,16 @@ class RegexRedactor:
         Returns:
             Cleaned text with non-overlapping redaction tags
         """
-        # Pattern to match consecutive redaction tags
-        pattern = r'\[REDACTED_[A-Z_]+\](\s*\[REDACTED_[A-Z_]+\])+'
-        
-        def replace_consecutive(match):
-            # Replace consecutive tags with a single generic tag
-            return '[REDACTED]'
-        
-        # Replace consecutive redaction tags
-        cleaned_text = re.sub(pattern, replace_consecutive, text)
-        
-        # Remove extra spaces around redaction tags
-        cleaned_text = re.sub(r'\s+\[REDACTED', ' [REDACTED', cleaned_text)
-        cleaned_text = re.sub(r'\]\s+', '] ', cleaned_text)
+        # Each pattern needs a literal that a plain substring check can rule out first
+        cleaned_text = text
+        if '[REDACTED' in cleaned_text:
+            # Replace consecutive redaction tags with a single generic tag
+            cleaned_text = cls._CONSECUTIVE_TAGS_RE.sub('[REDACTED]', cleaned_text)
+            
+            # Remove extra spaces around redaction tags
+            cleaned_text = cls._SPACE_BEFORE_TAG_RE.sub(' [REDACTED', cleaned_text)
+        if ']' in cleaned_text:
+            cleaned_text = cls._SPACE_AFTER_TAG_RE.sub('] ', cleaned_text)
         
         return cleaned_text
 
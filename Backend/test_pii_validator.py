@@ -0,0 +1,49 @@
+"""
+Regression tests for PIIValidator
+"""
+
+from pii_validator import PIIValidator
+
+
+def _pattern_hits(text):
+    """(type, position) of every high-precision pattern hit reported for text"""
+    return {
+        (pii['type'], pii['position'])
+        for pii in PIIValidator.validate_text(text)
+        if pii['confidence'] == 0.9
+    }
+
+
+def test_overlapping_validation_patterns_are_all_reported():
+    # Each pattern is scanned on its own, so overlapping types are not hidden by the first one
+    assert _pattern_hits("Zip 12345-6789") == {('ssn', (4, 14)), ('zip_code', (4, 14))}
+    assert _pattern_hits("Num 5551234567890123") == {('credit_card', (4, 20)), ('phone', (7, 20))}
+
+
+def test_validation_matches_per_pattern_scans():
+    text = "Call 555-123-4567, card 4111-1111-1111-1111, SSN 123-45-6789, ip 10.0.0.5"
+    expected = {
+        (pii_type, match.span())
+        for pii_type, pattern in PIIValidator.VALIDATION_PATTERNS.items()
+        for match in pattern.finditer(text)
+    }
+    assert _pattern_hits(text) == expected
+
+
+def test_enhance_redaction_skips_default_tags():
+    redacted = "Name: [REDACTED_NAME], SSN 123-45-6789"
+    assert PIIValidator.enhance_redaction("", redacted) == "Name: [REDACTED_NAME], SSN [REDACTED_SSN]"
+
+
+def test_enhance_redaction_skips_custom_tags():
+    custom_tags = {"ssn": "<SSN 000-00-0000>"}
+    redacted = "SSN <SSN 000-00-0000>, backup SSN 123-45-6789"
+    assert PIIValidator.enhance_redaction("", redacted, custom_tags) == (
+        "SSN <SSN 000-00-0000>, backup SSN [REDACTED_SSN]"
+    )
+
+
+def test_enhance_redaction_merges_overlapping_findings():
+    # A short early finding must not leave the longer overlapping one in clear text
+    assert PIIValidator.enhance_redaction("", "Acct 12345 555-123-4567") == "Acct [REDACTED_PHONE]"
+    assert PIIValidator.enhance_redaction("", "Ref 481943406-7700644") == "Ref [REDACTED_PHONE]"
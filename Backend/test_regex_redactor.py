@@ -0,0 +1,60 @@
+"""
+Regression tests for RegexRedactor
+"""
+
+from regex_redactor import RegexRedactor
+
+ALL_TYPES = RegexRedactor.get_supported_types()
+
+
+def _matched_chars(text):
+    """Positions of every character matched by any type"""
+    return {
+        position
+        for match in RegexRedactor.find_pii_matches(text, ALL_TYPES)
+        for position in range(match.start, match.end)
+    }
+
+
+def _redacted_chars(text):
+    """Positions of every character replaced by redact_text"""
+    return {
+        position
+        for start, end, _ in RegexRedactor._scan(text, RegexRedactor._plausible_types(text, ALL_TYPES))
+        for position in range(start, end)
+    }
+
+
+def test_redaction_covers_every_matched_character():
+    texts = [
+        "Ref AB 4111-1111-1111-1111",
+        "Unit 7 SSN 123-45-6789",
+        "Server IP 10.0.0.5",
+        "Suite B 555-123-4567",
+        "MAC 00:1B:44:11:3A:B7",
+        "EIN 12-3456789, contact John Smith at john@example.com",
+    ]
+    for text in texts:
+        assert _redacted_chars(text) == _matched_chars(text), text
+
+
+def test_longer_overlapping_match_is_not_cut_short():
+    # Short license_plate matches at the start used to hide the longer number after them
+    expected = {
+        "Ref AB 4111-1111-1111-1111": ("Ref [REDACTED_CREDIT_CARD]", "credit_card"),
+        "Unit 7 SSN 123-45-6789": ("Unit [REDACTED_SSN]", "ssn"),
+        "Server IP 10.0.0.5": ("Server [REDACTED_IP_ADDRESS]", "ip_address"),
+        "Suite B 555-123-4567": ("Suite [REDACTED_PHONE]", "phone"),
+        "MAC 00:1B:44:11:3A:B7": ("[REDACTED_MAC_ADDRESS]", "mac_address"),
+    }
+    for text, (redacted, pii_type) in expected.items():
+        result, summary = RegexRedactor.redact_text(text, ALL_TYPES)
+        assert result == redacted, text
+        assert summary[pii_type] == 1, text
+        assert sum(summary.values()) == 1, text
+
+
+def test_phone_with_no_break_spaces_is_redacted():
+    result, summary = RegexRedactor.redact_text("Call 555\xa0123\xa04567", ALL_TYPES)
+    assert result == "Call [REDACTED_PHONE]"
+    assert summary["phone"] == 1
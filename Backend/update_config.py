@@ -6,7 +6,6 @@ This script updates the config.env file to use the fine-tuned model.
 """
 
 import os
-import re
 
 def update_config_file():
     """Update the config.env file to use the fine-tuned model."""
@@ -20,12 +19,12 @@ def update_config_file():
     with open(config_file, 'r') as f:
         content = f.read()
     
-    # Update the MODEL_NAME
-    updated_content = re.sub(
-        r'MODEL_NAME=.*',
-        'MODEL_NAME=pii-detector',
-        content
-    )
+    # Update the MODEL_NAME line (text mode has already normalized newlines to '\n')
+    lines = content.split('\n')
+    for i, line in enumerate(lines):
+        if line.startswith('MODEL_NAME='):
+            lines[i] = 'MODEL_NAME=pii-detector'
+    updated_content = '\n'.join(lines)
     
     # Write the updated config
     with open(config_file, 'w') as f: